@@ -0,0 +1,4 @@
+"""
+MicroSpaceGen benchmark suite
+Seeded performance benchmarks for the analysis, blockchain and experiment hot paths.
+"""
@@ -0,0 +1,61 @@
+"""
+Synthetic Data Generators
+Seeded generators for benchmark inputs, so repeated runs time identical work.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+NUCLEOTIDES = "ATCG"
+# Fixed epoch so generated blocks and observations hash identically between runs
+EPOCH = datetime(2024, 1, 1)
+
+def random_sequence(length: int, seed: int = 0) -> str:
+    """Generate a random DNA sequence"""
+    rng = random.Random(seed)
+    return "".join(rng.choice(NUCLEOTIDES) for _ in range(length))
+
+def mutate_sequence(sequence: str, mutation_rate: float = 0.01, seed: int = 0) -> str:
+    """Apply random substitutions, insertions and deletions to a sequence"""
+    rng = random.Random(seed)
+    mutated = []
+    for nucleotide in sequence:
+        if rng.random() >= mutation_rate:
+            mutated.append(nucleotide)
+            continue
+        kind = rng.choice(("substitution", "insertion", "deletion"))
+        if kind == "substitution":
+            mutated.append(rng.choice(NUCLEOTIDES.replace(nucleotide, "")))
+        elif kind == "insertion":
+            mutated.append(nucleotide)
+            mutated.append(rng.choice(NUCLEOTIDES))
+    return "".join(mutated)
+
+def random_payload(size: int, seed: int = 0) -> Dict:
+    """Generate an experiment payload with roughly ``size`` observation entries"""
+    rng = random.Random(seed)
+    return {
+        "experiment_id": f"bench_{seed:04d}",
+        "observations": [
+            {
+                "temperature": round(rng.uniform(20.0, 40.0), 2),
+                "growth_rate": round(rng.random(), 4),
+                "cell_count": rng.randint(100, 100000)
+            }
+            for _ in range(size)
+        ]
+    }
+
+def random_observations(count: int, seed: int = 0) -> List[Dict]:
+    """Generate a batch of observations"""
+    rng = random.Random(seed)
+    return [
+        {
+            "temperature": round(rng.uniform(20.0, 40.0), 2),
+            "growth_rate": round(rng.random(), 4),
+            "cell_count": rng.randint(100, 100000),
+            "recorded_at": (EPOCH + timedelta(minutes=i)).isoformat()
+        }
+        for i in range(count)
+    ]
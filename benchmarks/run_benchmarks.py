@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+Times the analyzer, miner, chain verification and observation ingest hot
+paths, appends results to a JSON history and compares against a baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks run [--quick] [--save-baseline]
+    python -m benchmarks.run_benchmarks compare [--quick] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.generators import (
+    EPOCH, random_sequence, mutate_sequence, random_payload, random_observations
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+HISTORY_FILE = RESULTS_DIR / "history.json"
+BASELINE_FILE = RESULTS_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 0.2
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for one benchmark case"""
+    name: str
+    params: Dict
+    repeat: int
+    mean: float
+    median: float
+    min: float
+    stdev: float
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match results against a baseline"""
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]"
+
+@dataclass
+class Benchmark:
+    """A benchmark case: ``setup`` returns the callable that gets timed"""
+    name: str
+    params: Dict
+    setup: Callable[[], Callable[[], None]]
+    repeat: int = 5
+    quick: bool = True
+
+@dataclass
+class Regression:
+    """A benchmark that slowed down beyond the threshold"""
+    key: str
+    baseline: float
+    current: float
+    change: float = field(init=False)
+
+    def __post_init__(self):
+        self.change = (self.current - self.baseline) / self.baseline
+
+def time_benchmark(benchmark: Benchmark) -> BenchmarkResult:
+    """Run a benchmark ``repeat`` times, each against a fresh setup"""
+    timings = []
+    for _ in range(benchmark.repeat):
+        func = benchmark.setup()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return BenchmarkResult(
+        name=benchmark.name,
+        params=benchmark.params,
+        repeat=benchmark.repeat,
+        mean=statistics.mean(timings),
+        median=statistics.median(timings),
+        min=min(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0
+    )
+
+def _offline_storage(difficulty: int):
+    """BlockchainStorage with the Ethereum connection stubbed out"""
+    from src.blockchain.data_storage import BlockchainStorage
+
+    class OfflineBlockchainStorage(BlockchainStorage):
+        def __init__(self):
+            self.chain = []
+            self.pending_data = []
+            self.difficulty = difficulty
+
+        def _store_on_ethereum(self, block) -> None:
+            pass
+
+    return OfflineBlockchainStorage()
+
+def _analyzer_with(*sequences: str):
+    from src.analysis.gene_analyzer import GeneAnalyzer, GeneSequence
+
+    analyzer = GeneAnalyzer()
+    for i, sequence in enumerate(sequences):
+        analyzer.add_sequence(GeneSequence(
+            sequence_id=f"seq_{i}",
+            sequence=sequence,
+            organism="E. coli",
+            metadata={"source": "benchmark"}
+        ))
+    return analyzer
+
+def bench_analyze_mutations(length: int) -> Callable[[], None]:
+    analyzer = _analyzer_with(random_sequence(length, seed=length))
+    return lambda: analyzer.analyze_mutations("seq_0")
+
+def bench_compare_sequences(length: int) -> Callable[[], None]:
+    reference = random_sequence(length, seed=length)
+    analyzer = _analyzer_with(reference, mutate_sequence(reference, seed=length))
+    return lambda: analyzer.compare_sequences("seq_0", "seq_1")
+
+def bench_mine_block(difficulty: int, payload_size: int) -> Callable[[], None]:
+    from src.blockchain.data_storage import DataBlock
+
+    storage = _offline_storage(difficulty)
+    block = DataBlock(
+        block_id="block_0",
+        timestamp=EPOCH,
+        data=random_payload(payload_size, seed=payload_size),
+        previous_hash=None,
+        hash="",
+        nonce=0
+    )
+    return lambda: storage._mine_block(block)
+
+def _build_chain(length: int, difficulty: int):
+    from src.blockchain.data_storage import DataBlock
+
+    storage = _offline_storage(difficulty)
+    previous_hash = None
+    for i in range(length):
+        block = storage._mine_block(DataBlock(
+            block_id=f"block_{i}",
+            timestamp=EPOCH + timedelta(seconds=i),
+            data=random_payload(1, seed=i),
+            previous_hash=previous_hash,
+            hash="",
+            nonce=0
+        ))
+        storage.chain.append(block)
+        previous_hash = block.hash
+    return storage
+
+_chain_cache: Dict[int, object] = {}
+
+def bench_verify_chain(length: int) -> Callable[[], None]:
+    # verify_chain is read-only, so the mined chain is shared between repeats
+    if length not in _chain_cache:
+        _chain_cache[length] = _build_chain(length, difficulty=1)
+    storage = _chain_cache[length]
+
+    def run():
+        assert storage.verify_chain()
+    return run
+
+def bench_record_observation(count: int) -> Callable[[], None]:
+    from src.experiments.space_experiment import SpaceExperiment, ExperimentParameters
+
+    experiment = SpaceExperiment(ExperimentParameters(
+        experiment_id="bench_001",
+        microorganism_type="E. coli",
+        duration=30,
+        temperature=25.0,
+        radiation_level=0.5,
+        gravity_level=0.0,
+        start_date=EPOCH
+    ))
+    observations = random_observations(count, seed=count)
+
+    def run():
+        for observation in observations:
+            experiment.record_observation(observation)
+    return run
+
+def get_benchmarks() -> List[Benchmark]:
+    """All benchmark cases; ``quick`` ones form the smoke subset"""
+    benchmarks = []
+    for length in (100, 1000, 10000):
+        benchmarks.append(Benchmark(
+            "analyze_mutations", {"length": length},
+            lambda length=length: bench_analyze_mutations(length),
+            quick=length <= 1000
+        ))
+    for length in (50, 200, 500):
+        benchmarks.append(Benchmark(
+            "compare_sequences", {"length": length},
+            lambda length=length: bench_compare_sequences(length),
+            repeat=3, quick=length <= 200
+        ))
+    for difficulty in (1, 2, 3):
+        for payload_size in (1, 100):
+            benchmarks.append(Benchmark(
+                "mine_block", {"difficulty": difficulty, "payload_size": payload_size},
+                lambda d=difficulty, p=payload_size: bench_mine_block(d, p),
+                quick=difficulty <= 2
+            ))
+    for length in (1000, 10000):
+        benchmarks.append(Benchmark(
+            "verify_chain", {"length": length},
+            lambda length=length: bench_verify_chain(length),
+            repeat=3, quick=length <= 1000
+        ))
+    for count in (1000, 100000):
+        benchmarks.append(Benchmark(
+            "record_observation", {"count": count},
+            lambda count=count: bench_record_observation(count),
+            quick=count <= 1000
+        ))
+    return benchmarks
+
+def run_suite(quick: bool = False, pattern: Optional[str] = None) -> Dict:
+    """Run the benchmark suite and return a history record"""
+    results = []
+    for benchmark in get_benchmarks():
+        if quick and not benchmark.quick:
+            continue
+        if pattern and pattern not in benchmark.name:
+            continue
+        result = time_benchmark(benchmark)
+        print(f"{result.key:<50} mean={result.mean * 1000:10.3f} ms  "
+              f"min={result.min * 1000:10.3f} ms")
+        results.append(result)
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": {result.key: asdict(result) for result in results}
+    }
+
+def append_history(record: Dict, path: Path = HISTORY_FILE) -> None:
+    """Append a run record to the JSON history file"""
+    history = json.loads(path.read_text()) if path.exists() else []
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=4))
+
+def save_baseline(record: Dict, path: Path = BASELINE_FILE) -> None:
+    """Store a run record as the comparison baseline"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(record, indent=4))
+
+def compare(current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD,
+            metric: str = "median") -> List[Regression]:
+    """Find benchmarks whose ``metric`` slowed down by more than ``threshold``
+
+    Cases missing from either record are ignored.
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if not reference or reference[metric] <= 0:
+            continue
+        regression = Regression(key, reference[metric], result[metric])
+        if regression.change > threshold:
+            regressions.append(regression)
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="MicroSpaceGen benchmark suite")
+    parser.add_argument("command", choices=("run", "compare"))
+    parser.add_argument("--quick", action="store_true", help="run the smoke subset only")
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 2
+
+    record = run_suite(quick=args.quick, pattern=args.pattern)
+    append_history(record, args.history)
+    if args.save_baseline:
+        save_baseline(record, args.baseline)
+
+    if args.command == "compare":
+        regressions = compare(record, json.loads(args.baseline.read_text()), args.threshold)
+        for regression in regressions:
+            print(f"SLOWER {regression.key}: {regression.baseline * 1000:.3f} ms -> "
+                  f"{regression.current * 1000:.3f} ms ({regression.change:+.1%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
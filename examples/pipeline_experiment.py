@@ -0,0 +1,60 @@
+"""
+Example running experiment, gene analysis and blockchain steps as a staged pipeline
+"""
+
+from datetime import datetime
+from src.experiments.space_experiment import SpaceExperiment, ExperimentParameters
+from src.analysis.gene_analyzer import GeneSequence
+from src.blockchain.data_storage import BlockchainStorage
+from src.pipeline.experiment_pipeline import SampleRecord, build_experiment_pipeline
+
+def run_pipeline_experiment():
+    """Run a pipelined space experiment example"""
+    
+    blockchain = BlockchainStorage()
+    
+    params = ExperimentParameters(
+        experiment_id="pipeline_001",
+        microorganism_type="E. coli",
+        duration=30,
+        temperature=25.0,
+        radiation_level=0.5,
+        gravity_level=0.0,
+        start_date=datetime.now()
+    )
+    
+    experiment = SpaceExperiment(params)
+    experiment.start_experiment()
+    
+    # One sequenced sample per observation
+    records = [
+        SampleRecord(
+            observation={
+                "temperature": 25.0 + i * 0.1,
+                "growth_rate": 0.5,
+                "cell_count": 1000 + i * 100
+            },
+            sequence=GeneSequence(
+                sequence_id=f"seq_{i:03d}",
+                sequence="ATCGATCGATCG" * (i + 1),
+                organism="E. coli",
+                metadata={"source": "experiment"}
+            )
+        )
+        for i in range(10)
+    ]
+    
+    pipeline = build_experiment_pipeline(experiment, blockchain, analysis_workers=4)
+    results = pipeline.run(records)
+    print(f"Committed {len(results)} analysis reports")
+    
+    # Per-stage throughput and queue depth
+    for stage in pipeline.get_metrics():
+        print(f"Stage metrics: {stage}")
+    print(f"Bottleneck stage: {pipeline.bottleneck()}")
+    
+    experiment.end_experiment()
+    print(f"Experiment completed. Summary: {experiment.get_experiment_summary()}")
+
+if __name__ == "__main__":
+    run_pipeline_experiment()
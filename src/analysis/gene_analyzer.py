@@ -1,17 +1,17 @@
 """
 Gene Analysis Module
 Processes and analyzes genetic data from space experiments.
+
+Biopython is imported on first use rather than at module load, so importing
+this module (and ``src.main``) stays cheap for code paths that never align.
 """
 
-import numpy as np
+import math
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
-from Bio import SeqUtils
-from Bio.Seq import Seq
-from Bio.SeqUtils import GC
-from Bio import pairwise2
-from Bio.pairwise2 import format_alignment
 from datetime import datetime
+from src.utils.metrics import timed
+from src.analysis.variant_store import VariantSequence, VariantStore
 
 @dataclass
 class GeneSequence:
@@ -26,34 +26,67 @@ class GeneAnalyzer:
     
     def __init__(self):
         self.sequences: List[GeneSequence] = []
+        self.variant_store = VariantStore()
     
+    @timed("add_sequence")
     def add_sequence(self, sequence: GeneSequence) -> None:
         """Add a new gene sequence to the analysis"""
         if not self._validate_sequence(sequence.sequence):
             raise ValueError("Invalid DNA sequence")
         self.sequences.append(sequence)
     
+    @timed("add_variant_sequence")
+    def add_variant_sequence(self, sequence: GeneSequence, reference_id: str) -> VariantSequence:
+        """Add a sequence stored as variants against an existing reference sequence"""
+        if not self._validate_sequence(sequence.sequence):
+            raise ValueError("Invalid DNA sequence")
+        if any(s.sequence_id == sequence.sequence_id for s in self.sequences):
+            raise ValueError(f"Sequence {sequence.sequence_id} already exists")
+        if reference_id not in self.variant_store.references:
+            reference = next((s for s in self.sequences if s.sequence_id == reference_id), None)
+            if not reference or isinstance(reference, VariantSequence):
+                raise ValueError(f"Reference {reference_id} not found")
+            self.variant_store.add_reference(reference_id, reference.sequence)
+        
+        variant_sequence = self.variant_store.add_variant(
+            sequence.sequence_id,
+            reference_id,
+            sequence.sequence,
+            organism=sequence.organism,
+            metadata=sequence.metadata
+        )
+        self.sequences.append(variant_sequence)
+        return variant_sequence
+    
     def _validate_sequence(self, sequence: str) -> bool:
         """Validate if the sequence contains only valid DNA nucleotides"""
         valid_nucleotides = set('ATCG')
         return all(nucleotide in valid_nucleotides for nucleotide in sequence.upper())
     
+    @timed("analyze_mutations")
     def analyze_mutations(self, sequence_id: str) -> Dict:
         """Analyze mutations in a specific sequence"""
         sequence = next((s for s in self.sequences if s.sequence_id == sequence_id), None)
         if not sequence:
             raise ValueError(f"Sequence {sequence_id} not found")
         
+        from Bio.Seq import Seq
+        from Bio.SeqUtils import GC
+        
+        # Read once; variant sequences are rebuilt from their reference on access
+        bases = sequence.sequence
+        upper_bases = bases.upper()
+        
         # Calculate basic sequence statistics
-        gc_content = GC(Seq(sequence.sequence))
-        sequence_length = len(sequence.sequence)
+        gc_content = GC(Seq(bases))
+        sequence_length = len(bases)
         
         # Analyze nucleotide composition
         nucleotide_counts = {
-            'A': sequence.sequence.upper().count('A'),
-            'T': sequence.sequence.upper().count('T'),
-            'C': sequence.sequence.upper().count('C'),
-            'G': sequence.sequence.upper().count('G')
+            'A': upper_bases.count('A'),
+            'T': upper_bases.count('T'),
+            'C': upper_bases.count('C'),
+            'G': upper_bases.count('G')
         }
         
         # Calculate mutation potential based on GC content
@@ -65,8 +98,8 @@ class GeneAnalyzer:
             "sequence_length": sequence_length,
             "nucleotide_composition": nucleotide_counts,
             "mutation_potential": mutation_potential,
-            "mutation_positions": self._find_mutation_hotspots(sequence.sequence),
-            "mutation_types": self._analyze_mutation_types(sequence.sequence)
+            "mutation_positions": self._find_mutation_hotspots(bases),
+            "mutation_types": self._analyze_mutation_types(bases)
         }
     
     def _find_mutation_hotspots(self, sequence: str) -> List[int]:
@@ -105,14 +138,27 @@ class GeneAnalyzer:
         
         return mutation_types
     
+    @timed("compare_sequences")
     def compare_sequences(self, sequence_id1: str, sequence_id2: str) -> Dict:
-        """Compare two sequences for differences"""
+        """Compare two sequences for differences
+
+        Siblings of the same reference are compared from their variant sets;
+        their differences also carry a ``reference_position`` key giving the
+        position in the reference rather than in the alignment.
+        """
+        # Siblings of the same reference are compared from their variant sets
+        if self.variant_store.shares_reference(sequence_id1, sequence_id2):
+            return self.variant_store.compare(sequence_id1, sequence_id2, with_alignment=True)
+        
         seq1 = next((s for s in self.sequences if s.sequence_id == sequence_id1), None)
         seq2 = next((s for s in self.sequences if s.sequence_id == sequence_id2), None)
         
         if not seq1 or not seq2:
             raise ValueError("One or both sequences not found")
         
+        from Bio import pairwise2
+        from Bio.pairwise2 import format_alignment
+        
         # Perform sequence alignment
         alignments = pairwise2.align.globalms(
             seq1.sequence,
@@ -161,17 +207,18 @@ class GeneAnalyzer:
             raise ValueError(f"Sequence {sequence_id} not found")
         
         mutation_analysis = self.analyze_mutations(sequence_id)
+        bases = sequence.sequence
         
         return {
             "sequence_id": sequence_id,
             "organism": sequence.organism,
-            "sequence_length": len(sequence.sequence),
+            "sequence_length": len(bases),
             "analysis_timestamp": datetime.now().isoformat(),
             "results": {
                 "mutation_analysis": mutation_analysis,
                 "statistics": {
                     "gc_content": mutation_analysis["gc_content"],
-                    "sequence_complexity": self._calculate_sequence_complexity(sequence.sequence)
+                    "sequence_complexity": self._calculate_sequence_complexity(bases)
                 }
             }
         }
@@ -194,6 +241,6 @@ class GeneAnalyzer:
         for count in nucleotide_counts.values():
             if count > 0:
                 probability = count / total
-                entropy -= probability * np.log2(probability)
+                entropy -= probability * math.log2(probability)
         
         return entropy 
\ No newline at end of file
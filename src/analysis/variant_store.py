@@ -0,0 +1,376 @@
+"""
+Variant Store Module
+Stores sequences as variants against a reference so near-identical samples
+are held once and compared without re-aligning.
+
+Variants are derived once per sequence from its alignment to the reference.
+Two sequences registered against the same reference are then compared by
+walking their variant sets in reference coordinates, which costs
+O(variants) instead of an O(n*m) alignment.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+@dataclass(frozen=True)
+class Variant:
+    """A change relative to the reference, in 0-based reference coordinates
+
+    SNVs replace one base (``ref`` and ``alt`` are single bases), insertions
+    add ``alt`` before reference position ``position`` (``ref`` is empty) and
+    deletions remove ``ref`` starting at ``position`` (``alt`` is empty).
+    """
+    position: int
+    ref: str
+    alt: str
+
+    @property
+    def type(self) -> str:
+        if not self.ref:
+            return "insertion"
+        if not self.alt:
+            return "deletion"
+        return "snv"
+
+    @property
+    def end(self) -> int:
+        """Reference position just past the bases this variant consumes"""
+        return self.position + len(self.ref)
+
+@dataclass
+class VariantSequence:
+    """A sequence held as variants against a reference
+
+    Exposes the same attributes as ``GeneSequence``; ``sequence`` is
+    reconstructed from the reference on access, with the most recently used
+    reconstructions kept in the store's small LRU cache.
+    """
+    sequence_id: str
+    reference_id: str
+    variants: Tuple[Variant, ...]
+    organism: str
+    metadata: Dict
+    _store: "VariantStore" = field(repr=False, compare=False, default=None)
+
+    @property
+    def sequence(self) -> str:
+        return self._store.get_sequence(self.sequence_id)
+
+def derive_variants(reference: str, sequence: str) -> List[Variant]:
+    """Derive the variants turning ``reference`` into ``sequence``
+
+    The shared prefix and suffix are trimmed first so only the region that
+    differs is aligned, using the same scoring as ``compare_sequences``.
+    """
+    reference = reference.upper()
+    sequence = sequence.upper()
+
+    prefix = 0
+    limit = min(len(reference), len(sequence))
+    while prefix < limit and reference[prefix] == sequence[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and reference[-1 - suffix] == sequence[-1 - suffix]:
+        suffix += 1
+
+    ref_core = reference[prefix:len(reference) - suffix]
+    seq_core = sequence[prefix:len(sequence) - suffix]
+    if not ref_core:
+        return [Variant(prefix, "", seq_core)] if seq_core else []
+    if not seq_core:
+        return [Variant(prefix, ref_core, "")]
+
+    from Bio import pairwise2
+
+    alignment = pairwise2.align.globalms(ref_core, seq_core, 2, -1, -0.5, -0.1,
+                                         one_alignment_only=True)[0]
+    return _variants_from_alignment(alignment[0], alignment[1], offset=prefix)
+
+def _variants_from_alignment(aligned_ref: str, aligned_seq: str, offset: int = 0) -> List[Variant]:
+    """Collapse alignment columns into SNVs and runs of insertions/deletions"""
+    variants = []
+    position = offset
+    inserted = []
+    deleted_start = None
+    deleted = []
+
+    def flush():
+        nonlocal inserted, deleted, deleted_start
+        if deleted:
+            variants.append(Variant(deleted_start, "".join(deleted), ""))
+            deleted, deleted_start = [], None
+        if inserted:
+            variants.append(Variant(position, "", "".join(inserted)))
+            inserted = []
+
+    for ref_base, seq_base in zip(aligned_ref, aligned_seq):
+        if ref_base == "-":
+            if deleted:
+                flush()
+            inserted.append(seq_base)
+            continue
+        if seq_base == "-":
+            if inserted:
+                flush()
+            if deleted_start is None:
+                deleted_start = position
+            deleted.append(ref_base)
+        else:
+            flush()
+            if ref_base != seq_base:
+                variants.append(Variant(position, ref_base, seq_base))
+        position += 1
+    flush()
+    return variants
+
+class _VariantIndex:
+    """Per-position view of a variant set used for sibling comparison"""
+
+    def __init__(self, reference: str, variants: Iterable[Variant]):
+        self.substitutions: Dict[int, str] = {}
+        self.deletions = set()
+        self.insertions: Dict[int, str] = {}
+        for variant in variants:
+            if variant.type == "snv":
+                self.substitutions[variant.position] = variant.alt
+            elif variant.type == "deletion":
+                self.deletions.update(range(variant.position, variant.end))
+            else:
+                self.insertions[variant.position] = variant.alt
+        self.reference = reference
+
+    def positions(self) -> set:
+        return set(self.substitutions) | self.deletions | set(self.insertions)
+
+    def base_at(self, position: int) -> str:
+        if position in self.deletions:
+            return "-"
+        return self.substitutions.get(position, self.reference[position])
+
+class VariantStore:
+    """Holds references and the variant sets registered against them
+
+    Up to ``cache_size`` reconstructed sequences are kept so repeated reads
+    of the same sample do not rebuild it each time.
+    """
+
+    def __init__(self, cache_size: int = 8):
+        self.references: Dict[str, str] = {}
+        self.variant_sequences: Dict[str, VariantSequence] = {}
+        self.cache_size = cache_size
+        self._reconstructed: "OrderedDict[str, str]" = OrderedDict()
+
+    def add_reference(self, sequence_id: str, sequence: str) -> None:
+        """Register a full sequence that variants can be expressed against
+
+        An already upper-case string is stored as is, so the caller's copy is
+        shared rather than duplicated.
+        """
+        self.references[sequence_id] = sequence if sequence.isupper() else sequence.upper()
+
+    def add_variant(self, sequence_id: str, reference_id: str, sequence: str,
+                    organism: str = "", metadata: Optional[Dict] = None) -> VariantSequence:
+        """Align ``sequence`` to its reference once and store only the variants"""
+        reference = self._get_reference(reference_id)
+        return self.register_variants(sequence_id, reference_id,
+                                      derive_variants(reference, sequence),
+                                      organism, metadata)
+
+    def register_variants(self, sequence_id: str, reference_id: str,
+                          variants: Iterable[Variant], organism: str = "",
+                          metadata: Optional[Dict] = None) -> VariantSequence:
+        """Store a sequence given directly as variants against a reference"""
+        if sequence_id in self.references:
+            raise ValueError(f"Sequence {sequence_id} is already a reference")
+        reference = self._get_reference(reference_id)
+        ordered = tuple(sorted(variants, key=lambda v: (v.position, v.type != "insertion")))
+        self._validate(reference, ordered)
+        variant_sequence = VariantSequence(
+            sequence_id=sequence_id,
+            reference_id=reference_id,
+            variants=ordered,
+            organism=organism,
+            metadata=metadata or {},
+            _store=self
+        )
+        self.variant_sequences[sequence_id] = variant_sequence
+        self._reconstructed.pop(sequence_id, None)
+        return variant_sequence
+
+    def get_sequence(self, sequence_id: str) -> str:
+        """Reconstruct a full sequence from its reference and variants"""
+        if sequence_id in self.references:
+            return self.references[sequence_id]
+        cached = self._reconstructed.get(sequence_id)
+        if cached is not None:
+            self._reconstructed.move_to_end(sequence_id)
+            return cached
+        variant_sequence = self.variant_sequences.get(sequence_id)
+        if variant_sequence is None:
+            raise ValueError(f"Sequence {sequence_id} not found")
+        reference = self.references[variant_sequence.reference_id]
+        parts = []
+        cursor = 0
+        for variant in variant_sequence.variants:
+            parts.append(reference[cursor:variant.position])
+            parts.append(variant.alt)
+            cursor = variant.end
+        parts.append(reference[cursor:])
+        sequence = "".join(parts)
+        if self.cache_size > 0:
+            self._reconstructed[sequence_id] = sequence
+            if len(self._reconstructed) > self.cache_size:
+                self._reconstructed.popitem(last=False)
+        return sequence
+
+    def get_variants(self, sequence_id: str) -> Tuple[Variant, ...]:
+        """Variants of a sequence; a reference has none against itself"""
+        if sequence_id in self.references:
+            return ()
+        variant_sequence = self.variant_sequences.get(sequence_id)
+        if variant_sequence is None:
+            raise ValueError(f"Sequence {sequence_id} not found")
+        return variant_sequence.variants
+
+    def reference_of(self, sequence_id: str) -> Optional[str]:
+        """Reference ID a sequence is expressed against, if it is known"""
+        if sequence_id in self.references:
+            return sequence_id
+        variant_sequence = self.variant_sequences.get(sequence_id)
+        return variant_sequence.reference_id if variant_sequence else None
+
+    def shares_reference(self, sequence_id1: str, sequence_id2: str) -> bool:
+        """Whether two sequences can be compared from their variant sets"""
+        reference_id = self.reference_of(sequence_id1)
+        return reference_id is not None and reference_id == self.reference_of(sequence_id2)
+
+    def compare(self, sequence_id1: str, sequence_id2: str,
+                with_alignment: bool = False) -> Dict:
+        """Compare two sequences of the same reference from their variants
+
+        Returns the same keys as ``GeneAnalyzer.compare_sequences``. The two
+        sequences are aligned through the reference, so ``position`` is a
+        column of that implied alignment; ``reference_position`` is also
+        given for each difference. ``alignment`` is only built on request.
+        """
+        if not self.shares_reference(sequence_id1, sequence_id2):
+            raise ValueError("Sequences are not registered against the same reference")
+        reference = self.references[self.reference_of(sequence_id1)]
+        first = _VariantIndex(reference, self.get_variants(sequence_id1))
+        second = _VariantIndex(reference, self.get_variants(sequence_id2))
+
+        touched = sorted(first.positions() | second.positions())
+        untouched = len(reference) - sum(1 for p in touched if p < len(reference))
+        matches = untouched
+        columns = untouched
+        shift = 0  # columns gained from insertions minus columns lost to shared deletions
+        differences = []
+
+        for position in touched:
+            inserted1 = first.insertions.get(position, "")
+            inserted2 = second.insertions.get(position, "")
+            for offset in range(max(len(inserted1), len(inserted2))):
+                base1 = inserted1[offset] if offset < len(inserted1) else "-"
+                base2 = inserted2[offset] if offset < len(inserted2) else "-"
+                column = position + shift
+                shift += 1
+                columns += 1
+                if base1 == base2:
+                    matches += 1
+                else:
+                    differences.append(self._difference(column, position, base1, base2))
+            if position >= len(reference):
+                continue
+
+            base1 = first.base_at(position)
+            base2 = second.base_at(position)
+            if base1 == "-" and base2 == "-":
+                shift -= 1
+                continue
+            columns += 1
+            if base1 == base2:
+                matches += 1
+            else:
+                differences.append(self._difference(position + shift, position, base1, base2))
+
+        result = {
+            "similarity_score": matches / columns if columns else 0.0,
+            "differences": differences,
+            "alignment": ""
+        }
+        if with_alignment:
+            result["alignment"] = self._render_alignment(reference, first, second, touched)
+        return result
+
+    @staticmethod
+    def _difference(column: int, reference_position: int, base1: str, base2: str) -> Dict:
+        return {
+            "position": column,
+            "reference_position": reference_position,
+            "seq1_base": base1,
+            "seq2_base": base2,
+            "type": "mismatch" if base1 != "-" and base2 != "-" else "indel"
+        }
+
+    @staticmethod
+    def _render_alignment(reference: str, first: _VariantIndex, second: _VariantIndex,
+                          touched: List[int]) -> str:
+        """Build both aligned rows by slicing the reference between variants"""
+        rows1, rows2, markers = [], [], []
+        cursor = 0
+        for position in touched:
+            segment = reference[cursor:min(position, len(reference))]
+            rows1.append(segment)
+            rows2.append(segment)
+            markers.append("|" * len(segment))
+            inserted1 = first.insertions.get(position, "")
+            inserted2 = second.insertions.get(position, "")
+            width = max(len(inserted1), len(inserted2))
+            if width:
+                inserted1 = inserted1.ljust(width, "-")
+                inserted2 = inserted2.ljust(width, "-")
+                rows1.append(inserted1)
+                rows2.append(inserted2)
+                markers.append("".join("|" if a == b else " " for a, b in zip(inserted1, inserted2)))
+            if position >= len(reference):
+                cursor = position
+                continue
+            base1 = first.base_at(position)
+            base2 = second.base_at(position)
+            if base1 != "-" or base2 != "-":
+                rows1.append(base1)
+                rows2.append(base2)
+                markers.append("|" if base1 == base2 else ("." if "-" not in (base1, base2) else " "))
+            cursor = position + 1
+        tail = reference[cursor:]
+        rows1.append(tail)
+        rows2.append(tail)
+        markers.append("|" * len(tail))
+        return f"{''.join(rows1)}\n{''.join(markers)}\n{''.join(rows2)}\n"
+
+    def _get_reference(self, reference_id: str) -> str:
+        reference = self.references.get(reference_id)
+        if reference is None:
+            raise ValueError(f"Reference {reference_id} not found")
+        return reference
+
+    @staticmethod
+    def _validate(reference: str, variants: Tuple[Variant, ...]) -> None:
+        cursor = 0
+        last_insertion = None
+        for variant in variants:
+            if variant.type == "insertion":
+                if variant.position == last_insertion:
+                    raise ValueError(f"Variant {variant} repeats an insertion point")
+                last_insertion = variant.position
+            if variant.position < cursor or variant.end > len(reference):
+                raise ValueError(f"Variant {variant} overlaps another or lies outside the reference")
+            if variant.ref.upper() == variant.alt.upper():
+                raise ValueError(f"Variant {variant} does not change the reference")
+            if variant.type == "snv" and (len(variant.ref) != 1 or len(variant.alt) != 1):
+                raise ValueError(f"Variant {variant} must replace exactly one base")
+            if variant.ref and reference[variant.position:variant.end] != variant.ref.upper():
+                raise ValueError(f"Variant {variant} does not match the reference")
+            cursor = variant.end
@@ -1,6 +1,9 @@
 """
 Blockchain Data Storage Module
 Handles decentralized storage of experimental data and results.
+
+web3, eth_account and dotenv are imported when a storage is created rather
+than at module load, so importing this module stays cheap.
 """
 
 from typing import Dict, Optional, List
@@ -8,11 +11,13 @@ from datetime import datetime
 from dataclasses import dataclass
 import json
 import hashlib
+import logging
 import time
-from web3 import Web3
-from eth_account import Account
 import os
-from dotenv import load_dotenv
+from src.utils import metrics
+from src.utils.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class DataBlock:
@@ -32,6 +37,9 @@ class BlockchainStorage:
         self.pending_data: List[Dict] = []
         self.difficulty = 4  # Number of leading zeros required in hash
         
+        from dotenv import load_dotenv
+        from web3 import Web3
+        
         # Initialize Web3 connection
         load_dotenv()
         self.w3 = Web3(Web3.HTTPProvider(os.getenv('ETH_NODE_URL', 'http://localhost:8545')))
@@ -62,11 +70,25 @@ class BlockchainStorage:
     
     def _mine_block(self, block: DataBlock) -> DataBlock:
         """Mine a block by finding a valid nonce"""
+        started = time.perf_counter()
+        start_nonce = block.nonce
         while True:
             block.nonce += 1
             block.hash = self._calculate_hash(block)
             if block.hash.startswith('0' * self.difficulty):
-                return block
+                break
+        
+        logger.debug("Mined %s with nonce %d", block.block_id, block.nonce)
+        if metrics.is_enabled():
+            elapsed = time.perf_counter() - started
+            hashes = block.nonce - start_nonce
+            metrics.observe("mine_block_duration_seconds", elapsed, "Latency of _mine_block")
+            metrics.inc("mine_block_total", help_text="Blocks mined")
+            metrics.inc("mine_block_hashes_total", hashes, "Hashes tried while mining")
+            if elapsed > 0:
+                metrics.set_gauge("mine_block_hash_rate", hashes / elapsed,
+                                  "Hashes per second of the last mined block")
+        return block
     
     def add_data(self, data: Dict) -> str:
         """Add new data to the pending transactions"""
@@ -101,41 +123,45 @@ class BlockchainStorage:
     
     def _store_on_ethereum(self, block: DataBlock) -> None:
         """Store block data on Ethereum blockchain"""
+        # Imported outside the try so a missing dependency fails loudly
+        from eth_account import Account
+        
         try:
-            # Prepare transaction
-            account = Account.from_key(os.getenv('ETH_PRIVATE_KEY'))
-            nonce = self.w3.eth.get_transaction_count(account.address)
-            
-            # Convert block data to bytes
-            block_data = json.dumps({
-                'block_id': block.block_id,
-                'timestamp': block.timestamp.isoformat(),
-                'data': block.data,
-                'previous_hash': block.previous_hash,
-                'hash': block.hash,
-                'nonce': block.nonce
-            }).encode()
-            
-            # Create transaction
-            transaction = self.contract.functions.storeData(
-                block.block_id,
-                block_data
-            ).build_transaction({
-                'chainId': int(os.getenv('ETH_CHAIN_ID', '1')),
-                'gas': 2000000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': nonce
-            })
-            
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-            
-            # Wait for transaction receipt
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            
+            with metrics.track("ethereum_store"):
+                # Prepare transaction
+                account = Account.from_key(os.getenv('ETH_PRIVATE_KEY'))
+                nonce = self.w3.eth.get_transaction_count(account.address)
+                
+                # Convert block data to bytes
+                block_data = json.dumps({
+                    'block_id': block.block_id,
+                    'timestamp': block.timestamp.isoformat(),
+                    'data': block.data,
+                    'previous_hash': block.previous_hash,
+                    'hash': block.hash,
+                    'nonce': block.nonce
+                }).encode()
+                
+                # Create transaction
+                transaction = self.contract.functions.storeData(
+                    block.block_id,
+                    block_data
+                ).build_transaction({
+                    'chainId': int(os.getenv('ETH_CHAIN_ID', '1')),
+                    'gas': 2000000,
+                    'gasPrice': self.w3.eth.gas_price,
+                    'nonce': nonce
+                })
+                
+                # Sign and send transaction
+                signed_txn = self.w3.eth.account.sign_transaction(transaction, account.key)
+                tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+                
+                # Wait for transaction receipt
+                self.w3.eth.wait_for_transaction_receipt(tx_hash)
+                
         except Exception as e:
-            print(f"Failed to store data on Ethereum: {str(e)}")
+            logger.warning("Failed to store data on Ethereum: %s", e)
             # Continue with local storage even if blockchain storage fails
     
     def get_block(self, block_id: str) -> Optional[DataBlock]:
@@ -159,10 +185,11 @@ class BlockchainStorage:
                     nonce=block_dict['nonce']
                 )
         except Exception as e:
-            print(f"Failed to retrieve block from blockchain: {str(e)}")
+            logger.warning("Failed to retrieve block from blockchain: %s", e)
         
         return None
     
+    @timed("verify_chain")
     def verify_chain(self) -> bool:
         """Verify the integrity of the blockchain"""
         for i in range(1, len(self.chain)):
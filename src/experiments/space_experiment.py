@@ -3,9 +3,13 @@ Space Experiment Module
 Handles the core functionality for space-based microbial experiments.
 """
 
+import logging
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
+from src.utils.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class ExperimentParameters:
@@ -38,12 +42,15 @@ class SpaceExperiment:
             self.status = "failed"
             raise Exception(f"Failed to start experiment: {str(e)}")
     
+    @timed("record_observation")
     def record_observation(self, observation: Dict) -> None:
         """Record an observation during the experiment"""
         self.observations.append({
             "timestamp": datetime.now(),
             "data": observation
         })
+        logger.debug("Recorded observation %d for %s",
+                     len(self.observations), self.parameters.experiment_id)
     
     def end_experiment(self) -> bool:
         """End the space experiment"""
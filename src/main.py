@@ -4,6 +4,7 @@ Main entry point for MicroSpaceGen application
 
 import logging
 from src.utils.helpers import setup_logging, load_config
+from src.utils import metrics
 from src.experiments.space_experiment import SpaceExperiment, ExperimentParameters
 from src.analysis.gene_analyzer import GeneAnalyzer, GeneSequence
 from src.blockchain.data_storage import BlockchainStorage
@@ -11,14 +12,29 @@ from datetime import datetime
 
 def main():
     """Main application entry point"""
-    # Setup logging
+    # Setup basic logging so config errors are reported
     setup_logging()
     logger = logging.getLogger(__name__)
     
+    profiler = None
     try:
-        # Load configuration
+        # Load configuration and switch to its logging section when present
         config = load_config("config/config.json")
-        logger.info(f"Starting {config['project']['name']} v{config['project']['version']}")
+        log_config = config.get("logging")
+        if log_config:
+            setup_logging(log_config.get("level", "INFO"), log_config)
+        
+        logger.info("Starting %s v%s", config['project']['name'], config['project']['version'])
+        
+        # Record metrics and optionally profile the run. This entry point exits
+        # right away, so it does not serve /metrics; long-running workers call
+        # metrics.start_metrics_server() themselves.
+        metrics_config = config.get("metrics", {})
+        if metrics_config.get("enabled"):
+            metrics.enable()
+        if metrics_config.get("profiling"):
+            profiler = metrics.SamplingProfiler()
+            profiler.start()
         
         # Initialize components
         blockchain = BlockchainStorage()
@@ -52,8 +68,12 @@ def main():
         logger.info("Application started successfully")
         
     except Exception as e:
-        logger.error(f"Application failed to start: {str(e)}")
+        logger.error("Application failed to start: %s", e)
         raise
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            logger.info("Profile:\n%s", profiler.report())
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
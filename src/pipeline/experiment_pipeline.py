@@ -0,0 +1,58 @@
+"""
+Experiment Pipeline Module
+Wires the experiment, gene analysis and blockchain steps into a staged
+pipeline so that sequence alignment and chain submission overlap.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict
+
+from src.analysis.gene_analyzer import GeneAnalyzer, GeneSequence
+from src.blockchain.data_storage import BlockchainStorage
+from src.experiments.space_experiment import SpaceExperiment
+from src.pipeline.runner import PipelineRunner, Stage
+
+@dataclass
+class SampleRecord:
+    """An observation together with the sequence sampled alongside it"""
+    observation: Dict
+    sequence: GeneSequence
+
+def analyze_sequence(sequence: GeneSequence) -> Dict:
+    """Generate an analysis report for a single sequence
+
+    Runs in a worker process, so it builds its own analyzer.
+    """
+    analyzer = GeneAnalyzer()
+    analyzer.add_sequence(sequence)
+    return analyzer.generate_report(sequence.sequence_id)
+
+def build_experiment_pipeline(experiment: SpaceExperiment,
+                              blockchain: BlockchainStorage,
+                              analysis_workers: int = 2,
+                              submission_workers: int = 4,
+                              ordered: bool = True,
+                              queue_size: int = 16) -> PipelineRunner:
+    """Build a pipeline that records, analyzes and commits sample records"""
+
+    async def record(record: SampleRecord) -> GeneSequence:
+        # Runs on the event loop, so observations are appended one at a time
+        experiment.record_observation(record.observation)
+        return record.sequence
+
+    async def submit(report: Dict) -> Dict:
+        payload = {
+            "experiment_id": experiment.parameters.experiment_id,
+            "report": report
+        }
+        loop = asyncio.get_running_loop()
+        status = await loop.run_in_executor(None, blockchain.add_data, payload)
+        return {"sequence_id": report["sequence_id"], "status": status}
+
+    stages = [
+        Stage("experiment", record, executor="async"),
+        Stage("analysis", analyze_sequence, concurrency=analysis_workers, executor="process"),
+        Stage("blockchain", submit, concurrency=submission_workers, executor="async"),
+    ]
+    return PipelineRunner(stages, ordered=ordered, queue_size=queue_size)
@@ -0,0 +1,303 @@
+"""
+Pipeline Runner Module
+Runs items through a chain of stages connected by bounded queues so that
+CPU-bound analysis and I/O-bound submission can overlap.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ("thread", "process", "async")
+
+@dataclass
+class Stage:
+    """A single pipeline stage
+
+    ``executor`` selects how ``func`` runs: ``"process"`` for CPU-bound work
+    (``func`` must be a picklable top-level function), ``"thread"`` for
+    blocking I/O and ``"async"`` for coroutine functions awaited on the loop.
+    """
+    name: str
+    func: Callable[[Any], Any]
+    concurrency: int = 1
+    executor: str = "thread"
+    queue_size: Optional[int] = None
+
+    def __post_init__(self):
+        if self.executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor '{self.executor}' for stage {self.name}")
+        if self.concurrency < 1:
+            raise ValueError(f"Stage {self.name} needs a concurrency of at least 1")
+        if self.executor == "async" and not asyncio.iscoroutinefunction(self.func):
+            raise ValueError(f"Stage {self.name} uses the async executor but func is not a coroutine function")
+
+@dataclass
+class StageMetrics:
+    """Throughput and queue-depth counters for one stage"""
+    name: str
+    concurrency: int
+    processed: int = 0
+    failed: int = 0
+    busy_time: float = 0.0
+    queue_depth_max: int = 0
+    queue_depth_total: int = 0
+    queue_depth_samples: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def sample_queue_depth(self, depth: int) -> None:
+        """Record the depth of the stage's input queue"""
+        self.queue_depth_max = max(self.queue_depth_max, depth)
+        self.queue_depth_total += depth
+        self.queue_depth_samples += 1
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items completed per second of wall-clock time"""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker capacity spent busy (close to 1.0 means bottleneck)"""
+        capacity = self.elapsed * self.concurrency
+        return min(self.busy_time / capacity, 1.0) if capacity > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        """Get a snapshot of the stage metrics"""
+        return {
+            "stage": self.name,
+            "concurrency": self.concurrency,
+            "processed": self.processed,
+            "failed": self.failed,
+            "throughput": self.throughput,
+            "utilization": self.utilization,
+            "mean_service_time": self.busy_time / self.processed if self.processed else 0.0,
+            "queue_depth_max": self.queue_depth_max,
+            "queue_depth_mean": (
+                self.queue_depth_total / self.queue_depth_samples
+                if self.queue_depth_samples else 0.0
+            ),
+        }
+
+@dataclass
+class StageError:
+    """An item that failed in a stage and was dropped from the pipeline"""
+    index: int
+    stage: str
+    error: BaseException
+
+# Marks the end of input on a queue; one is sent per downstream worker
+_DONE = object()
+# Stands in for the result of an item that failed in an earlier stage
+_FAILED = object()
+
+class PipelineRunner:
+    """Runs items through stages connected by bounded queues
+
+    Each stage has its own input queue bounded by ``queue_size``, so a slow
+    stage applies backpressure to everything upstream of it. Results are
+    returned in input order when ``ordered`` is True, otherwise in completion
+    order. Items that raise in a stage are recorded in ``errors`` and dropped;
+    so are exceptions from ``on_result``, under the stage name ``"on_result"``.
+
+    At most ``max_in_flight`` items are admitted at once (by default the
+    larger of ``queue_size`` and the total stage concurrency), which also
+    bounds the reorder buffer when a slow item holds up ordered output.
+    """
+
+    def __init__(self, stages: List[Stage], ordered: bool = True,
+                 queue_size: int = 16,
+                 on_result: Optional[Callable[[Any], None]] = None,
+                 max_in_flight: Optional[int] = None):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.ordered = ordered
+        self.queue_size = queue_size
+        self.on_result = on_result
+        self.max_in_flight = max_in_flight or max(
+            queue_size, sum(stage.concurrency for stage in stages)
+        )
+        self.max_pending = 0
+        self.metrics: Dict[str, StageMetrics] = {
+            stage.name: StageMetrics(stage.name, stage.concurrency) for stage in stages
+        }
+        self.errors: List[StageError] = []
+        self._stopping = False
+
+    def stop(self) -> None:
+        """Stop accepting new input; items already in flight are drained"""
+        self._stopping = True
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """Run the pipeline to completion from synchronous code"""
+        return asyncio.run(self.run_async(items))
+
+    async def run_async(self, items: Iterable[Any]) -> List[Any]:
+        """Run the pipeline to completion and return the final results"""
+        self._stopping = False
+        self.errors = []
+        self.max_pending = 0
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self.metrics = {
+            stage.name: StageMetrics(stage.name, stage.concurrency) for stage in self.stages
+        }
+        executors = [self._create_executor(stage) for stage in self.stages]
+        queues = [
+            asyncio.Queue(maxsize=stage.queue_size or self.queue_size)
+            for stage in self.stages
+        ]
+        sink: asyncio.Queue = asyncio.Queue()
+        results: List[Any] = []
+        tasks: List[asyncio.Future] = []
+
+        try:
+            workers = []
+            for i, stage in enumerate(self.stages):
+                out_queue = queues[i + 1] if i + 1 < len(queues) else sink
+                self.metrics[stage.name].started_at = time.perf_counter()
+                workers.append([
+                    asyncio.ensure_future(
+                        self._worker(stage, executors[i], queues[i], out_queue)
+                    )
+                    for _ in range(stage.concurrency)
+                ])
+                tasks.extend(workers[-1])
+
+            collector = asyncio.ensure_future(self._collect(sink, results))
+            tasks.append(collector)
+            await self._feed(items, queues[0])
+
+            # Drain stage by stage: once every worker of a stage has exited,
+            # nothing more can reach the next stage, so it can be closed too.
+            for i, stage in enumerate(self.stages):
+                for _ in range(stage.concurrency):
+                    await queues[i].put(_DONE)
+                await asyncio.gather(*workers[i])
+                self.metrics[stage.name].finished_at = time.perf_counter()
+            await sink.put(_DONE)
+            await collector
+        finally:
+            # On an early exit (e.g. the input iterable raised) stop the tasks
+            # first so none of them submits to an executor being shut down
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for executor in executors:
+                if executor is not None:
+                    executor.shutdown(wait=True)
+
+        return results
+
+    def get_metrics(self) -> List[Dict]:
+        """Get per-stage metrics in pipeline order"""
+        return [self.metrics[stage.name].to_dict() for stage in self.stages]
+
+    def bottleneck(self) -> Optional[str]:
+        """Name of the stage with the highest utilization"""
+        snapshot = self.get_metrics()
+        if not snapshot:
+            return None
+        return max(snapshot, key=lambda m: m["utilization"])["stage"]
+
+    def _create_executor(self, stage: Stage) -> Optional[Executor]:
+        if stage.executor == "process":
+            return ProcessPoolExecutor(max_workers=stage.concurrency)
+        if stage.executor == "thread":
+            return ThreadPoolExecutor(max_workers=stage.concurrency,
+                                      thread_name_prefix=f"pipeline-{stage.name}")
+        return None
+
+    async def _feed(self, items: Iterable[Any], queue: asyncio.Queue) -> None:
+        metrics = self.metrics[self.stages[0].name]
+        for index, item in enumerate(items):
+            if self._stopping:
+                logger.info("Pipeline stopping, no longer accepting input")
+                break
+            await self._in_flight.acquire()
+            await queue.put((index, item))
+            metrics.sample_queue_depth(queue.qsize())
+
+    async def _worker(self, stage: Stage, executor: Optional[Executor],
+                      in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics[stage.name]
+        next_metrics = self._next_metrics(stage)
+        while True:
+            entry = await in_queue.get()
+            if entry is _DONE:
+                return
+            index, item = entry
+            if item is _FAILED:
+                await out_queue.put(entry)
+                continue
+            started = time.perf_counter()
+            try:
+                if executor is None:
+                    result = await stage.func(item)
+                else:
+                    result = await loop.run_in_executor(executor, stage.func, item)
+            except Exception as e:
+                metrics.failed += 1
+                metrics.busy_time += time.perf_counter() - started
+                self.errors.append(StageError(index, stage.name, e))
+                logger.error("Stage %s failed on item %d: %s", stage.name, index, e)
+                await out_queue.put((index, _FAILED))
+                continue
+            metrics.processed += 1
+            metrics.busy_time += time.perf_counter() - started
+            await out_queue.put((index, result))
+            if next_metrics is not None:
+                next_metrics.sample_queue_depth(out_queue.qsize())
+
+    def _next_metrics(self, stage: Stage) -> Optional[StageMetrics]:
+        position = self.stages.index(stage)
+        if position + 1 < len(self.stages):
+            return self.metrics[self.stages[position + 1].name]
+        return None
+
+    async def _collect(self, sink: asyncio.Queue, results: List[Any]) -> None:
+        pending: Dict[int, Any] = {}
+        next_index = 0
+        while True:
+            entry = await sink.get()
+            if entry is _DONE:
+                break
+            index, result = entry
+            if not self.ordered:
+                self._emit(index, result, results)
+                continue
+            pending[index] = result
+            self.max_pending = max(self.max_pending, len(pending))
+            # Failed items still occupy their slot so later results aren't held back
+            while next_index in pending:
+                self._emit(next_index, pending.pop(next_index), results)
+                next_index += 1
+
+    def _emit(self, index: int, result: Any, results: List[Any]) -> None:
+        self._in_flight.release()
+        if result is _FAILED:
+            return
+        results.append(result)
+        if self.on_result is not None:
+            # A failing callback must not kill the collector, or the feeder
+            # would wait forever for in-flight slots
+            try:
+                self.on_result(result)
+            except Exception as e:
+                self.errors.append(StageError(index, "on_result", e))
+                logger.error("on_result failed on item %d: %s", index, e)
@@ -9,8 +9,16 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Setup logging configuration"""
+def setup_logging(log_level: str = "INFO", log_config: Optional[Dict[str, Any]] = None) -> None:
+    """Setup logging configuration
+
+    With ``log_config`` (the ``logging`` section of the config file) records
+    are handed to a background thread that writes the rotating log file.
+    """
+    if log_config is not None:
+        from src.utils.logging_pipeline import setup_queue_logging
+        setup_queue_logging(log_config, log_level)
+        return
     logging.basicConfig(
         level=getattr(logging, log_level),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -22,7 +30,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
         with open(config_path, 'r') as f:
             return json.load(f)
     except Exception as e:
-        logging.error(f"Failed to load config: {str(e)}")
+        logging.error("Failed to load config: %s", e)
         raise
 
 def save_data(data: Dict[str, Any], filepath: str) -> bool:
@@ -33,7 +41,7 @@ def save_data(data: Dict[str, Any], filepath: str) -> bool:
             json.dump(data, f, indent=4)
         return True
     except Exception as e:
-        logging.error(f"Failed to save data: {str(e)}")
+        logging.error("Failed to save data: %s", e)
         return False
 
 def load_data(filepath: str) -> Optional[Dict[str, Any]]:
@@ -42,7 +50,7 @@ def load_data(filepath: str) -> Optional[Dict[str, Any]]:
         with open(filepath, 'r') as f:
             return json.load(f)
     except Exception as e:
-        logging.error(f"Failed to load data: {str(e)}")
+        logging.error("Failed to load data: %s", e)
         return None
 
 def generate_timestamp() -> str:
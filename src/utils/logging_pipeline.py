@@ -0,0 +1,196 @@
+"""
+Logging Pipeline Module
+Queue-based, non-blocking logging: producers only enqueue records and a
+background listener formats them and writes the size-rotated log file.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Renders tracebacks on the producer side, before the record is queued
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback separate from the message
+
+    The stock ``prepare`` folds the traceback into ``msg``, so formatters on
+    the listener side cannot tell it apart. Here the traceback is rendered
+    into ``exc_text`` on the producer (the traceback objects themselves are
+    not safe to pass across threads) and ``msg`` holds just the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class RateLimitFilter(logging.Filter):
+    """Drops repetitive records beyond a per-message rate
+
+    Records are keyed by logger and unformatted message template, so lazily
+    formatted calls such as ``logger.debug("Mined %s", block_id)`` share one
+    budget. Each key may log ``burst`` records per ``period`` seconds; the next
+    record let through after a suppression notes how many were dropped.
+    Records at ``passthrough_level`` or above are never limited.
+
+    Expired windows are swept once per ``period`` so unique messages do not
+    accumulate. Past ``max_keys`` windows the oldest are dropped, even if
+    their suppression count has not been reported yet.
+    """
+
+    def __init__(self, burst: int = 20, period: float = 1.0,
+                 passthrough_level: int = logging.WARNING, max_keys: int = 10000):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self.passthrough_level = passthrough_level
+        self.max_keys = max_keys
+        self._windows: Dict[Tuple[str, Any], list] = {}
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired windows; keep those still owing a suppression notice"""
+        crowded = len(self._windows) > self.max_keys
+        self._windows = {
+            key: window for key, window in self._windows.items()
+            if now - window[0] < self.period or (window[2] and not crowded)
+        }
+        if len(self._windows) > self.max_keys:
+            # Still crowded by live windows: keep the newest half of the cap
+            newest = sorted(self._windows.items(), key=lambda item: item[1][0])
+            self._windows = dict(newest[-(self.max_keys // 2):])
+        self._last_sweep = now
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.passthrough_level:
+            return True
+        # msg may be any object (e.g. a dict); only strings are used as-is
+        template = record.msg if isinstance(record.msg, str) else repr(record.msg)
+        key = (record.name, template)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.period or len(self._windows) > self.max_keys:
+                self._sweep(now)
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                window = self._windows[key] = [now, 0, 0]
+            else:
+                suppressed = 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                return False
+            window[1] += 1
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.getMessage()} (suppressed {suppressed} similar messages)"
+            record.args = None
+        return True
+
+def setup_queue_logging(log_config: Dict[str, Any],
+                        log_level: Optional[str] = None) -> logging.handlers.QueueListener:
+    """Route the root logger through a queue to a rotating file
+
+    ``log_config`` is the ``logging`` section of ``config/config.json``:
+    ``file``, ``max_size`` and ``backup_count`` configure the rotating file,
+    ``json_lines`` switches to JSON output, ``console`` also echoes to stderr
+    and ``rate_limit`` (``burst``/``period``) limits repetitive messages.
+    Calling it again replaces the previous pipeline.
+    """
+    global _listener
+    stop_queue_logging()
+
+    level = getattr(logging, (log_level or log_config.get("level", "INFO")).upper())
+    formatter = JsonFormatter() if log_config.get("json_lines") else logging.Formatter(DEFAULT_FORMAT)
+
+    handlers = []
+    log_file = log_config.get("file")
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=log_config.get("max_size", 0),
+            backupCount=log_config.get("backup_count", 0),
+            encoding="utf-8"
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    if log_config.get("console", not log_file):
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = StructuredQueueHandler(log_queue)
+    rate_limit = log_config.get("rate_limit")
+    if rate_limit:
+        # Filter on the producer side so dropped records are never enqueued
+        queue_handler.addFilter(RateLimitFilter(
+            burst=rate_limit.get("burst", 20),
+            period=rate_limit.get("period", 1.0)
+        ))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def stop_queue_logging() -> None:
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+atexit.register(stop_queue_logging)
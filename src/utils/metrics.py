@@ -0,0 +1,310 @@
+"""
+Metrics Module
+Lightweight counters, latency histograms, a Prometheus text exporter and an
+opt-in sampling profiler for the hot paths.
+
+Instrumentation is disabled by default; in that mode ``timed`` wrappers and
+``track`` blocks only check a flag and fall straight through.
+"""
+
+import bisect
+import functools
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter as _FrameCounter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = "microspacegen_"
+
+class Counter:
+    """Monotonically increasing counter"""
+
+    def __init__(self, name: str, help_text: str = ""):
+        self.name = name
+        self.help = help_text
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+class Gauge:
+    """Value that can go up and down"""
+
+    def __init__(self, name: str, help_text: str = ""):
+        self.name = name
+        self.help = help_text
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+class Histogram:
+    """Cumulative bucketed histogram, as in the Prometheus data model"""
+
+    def __init__(self, name: str, help_text: str = "",
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value) if value != int(value) else str(int(value))
+
+class MetricsRegistry:
+    """Holds every metric by name and renders the text exposition"""
+
+    def __init__(self):
+        self.enabled = False
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help_text: str):
+        name = METRIC_PREFIX + name
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, cls(name, help_text))
+        return metric
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str = "") -> Gauge:
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name: str, help_text: str = "") -> Histogram:
+        return self._get(Histogram, name, help_text)
+
+    def get(self, name: str) -> Optional[object]:
+        """Look up a metric by its unprefixed name"""
+        return self._metrics.get(METRIC_PREFIX + name)
+
+    def reset(self) -> None:
+        """Drop every recorded metric"""
+        with self._lock:
+            self._metrics.clear()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+def enable() -> None:
+    """Start recording metrics"""
+    registry.enabled = True
+
+def disable() -> None:
+    """Stop recording metrics; instrumented code falls straight through"""
+    registry.enabled = False
+
+def is_enabled() -> bool:
+    return registry.enabled
+
+def inc(name: str, amount: float = 1.0, help_text: str = "") -> None:
+    """Increment a counter when metrics are enabled"""
+    if registry.enabled:
+        registry.counter(name, help_text).inc(amount)
+
+def set_gauge(name: str, value: float, help_text: str = "") -> None:
+    """Set a gauge when metrics are enabled"""
+    if registry.enabled:
+        registry.gauge(name, help_text).set(value)
+
+def observe(name: str, value: float, help_text: str = "") -> None:
+    """Record a histogram observation when metrics are enabled"""
+    if registry.enabled:
+        registry.histogram(name, help_text).observe(value)
+
+def _record_call(name: str, elapsed: float, failed: bool) -> None:
+    registry.histogram(f"{name}_duration_seconds", f"Latency of {name}").observe(elapsed)
+    registry.counter(f"{name}_total", f"Calls to {name}").inc()
+    if failed:
+        registry.counter(f"{name}_failures_total", f"Failed calls to {name}").inc()
+
+@contextmanager
+def track(name: str) -> Iterator[None]:
+    """Record latency, call count and failures for a block of code"""
+    if not registry.enabled:
+        yield
+        return
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record_call(name, time.perf_counter() - started, failed)
+
+def timed(name: str) -> Callable:
+    """Decorator recording latency, call count and failures for a function"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                _record_call(name, time.perf_counter() - started, failed)
+        return wrapper
+    return decorator
+
+def start_metrics_server(port: int = 9100, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """Serve ``/metrics`` from a daemon thread and enable recording
+
+    Pass ``port=0`` to bind an ephemeral port; the bound address is on
+    ``server.server_address``. Call ``server.shutdown()`` to stop it.
+    """
+    # http.server pulls in email and http.client, so only import it when serving
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    enable()
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
+
+class SamplingProfiler:
+    """Statistical profiler sampling the stacks of other threads
+
+    Every ``interval`` seconds the innermost frames of each thread are
+    counted, which is cheap enough to leave on while reproducing slow runs.
+    """
+
+    def __init__(self, interval: float = 0.005, depth: int = 1):
+        self.interval = interval
+        self.depth = depth
+        self.samples: _FrameCounter = _FrameCounter()
+        self.total_samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.depth:
+                    code = frame.f_code
+                    stack.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+                self.total_samples += 1
+
+    def top(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """Most frequently sampled locations"""
+        return self.samples.most_common(limit)
+
+    def report(self, limit: int = 20) -> str:
+        lines = [f"{self.total_samples} samples every {self.interval * 1000:.1f} ms"]
+        for location, count in self.top(limit):
+            share = count / self.total_samples if self.total_samples else 0.0
+            lines.append(f"{share:7.2%}  {count:6d}  {location}")
+        return "\n".join(lines)
+
+@contextmanager
+def profile(interval: float = 0.005, depth: int = 1) -> Iterator[SamplingProfiler]:
+    """Sample stacks while the block runs"""
+    profiler = SamplingProfiler(interval, depth)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+if os.getenv("MICROSPACEGEN_METRICS", "").lower() in ("1", "true", "yes"):
+    enable()
@@ -0,0 +1,69 @@
+"""
+Test cases for benchmark suite helpers
+"""
+
+import json
+from benchmarks.generators import random_sequence, mutate_sequence, random_observations
+from benchmarks.run_benchmarks import (
+    Benchmark, append_history, compare, main, time_benchmark
+)
+
+def test_generators_are_seeded():
+    """Test generators return identical data for the same seed"""
+    assert random_sequence(200, seed=1) == random_sequence(200, seed=1)
+    assert random_sequence(200, seed=1) != random_sequence(200, seed=2)
+    assert set(random_sequence(200)) <= set("ATCG")
+
+    reference = random_sequence(500, seed=3)
+    mutated = mutate_sequence(reference, mutation_rate=0.05, seed=3)
+    assert mutated == mutate_sequence(reference, mutation_rate=0.05, seed=3)
+    assert mutated != reference
+    assert random_observations(10, seed=4) == random_observations(10, seed=4)
+
+def test_time_benchmark():
+    """Test timing statistics for a benchmark case"""
+    result = time_benchmark(Benchmark("noop", {"size": 1}, lambda: (lambda: None), repeat=3))
+    assert result.key == "noop[size=1]"
+    assert result.repeat == 3
+    assert 0 <= result.min <= result.median
+
+def test_compare_flags_slowdowns():
+    """Test compare only flags cases beyond the threshold"""
+    baseline = {"results": {
+        "a[n=1]": {"median": 1.0},
+        "b[n=1]": {"median": 1.0},
+        "c[n=1]": {"median": 1.0}
+    }}
+    current = {"results": {
+        "a[n=1]": {"median": 1.1},
+        "b[n=1]": {"median": 1.5},
+        "d[n=1]": {"median": 9.0}
+    }}
+
+    regressions = compare(current, baseline, threshold=0.2)
+    assert [r.key for r in regressions] == ["b[n=1]"]
+    assert abs(regressions[0].change - 0.5) < 1e-9
+
+def test_history_and_compare_cli(tmp_path):
+    """Test runs are appended to history and compared to the baseline"""
+    history = tmp_path / "history.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "record_observation", "--quick",
+            "--history", str(history), "--baseline", str(baseline)]
+
+    # The compare without a baseline exits before running anything
+    assert main(["compare"] + args) == 2
+    assert not history.exists()
+    assert main(["run", "--save-baseline"] + args) == 0
+    assert main(["compare", "--threshold", "1000"] + args) == 0
+
+    records = json.loads(history.read_text())
+    assert len(records) == 2
+    assert "record_observation[count=1000]" in records[-1]["results"]
+
+def test_append_history_creates_file(tmp_path):
+    """Test history file is created on first append"""
+    path = tmp_path / "nested" / "history.json"
+    append_history({"results": {}}, path)
+    append_history({"results": {}}, path)
+    assert len(json.loads(path.read_text())) == 2
@@ -0,0 +1,76 @@
+"""
+Test cases for experiment pipeline module
+"""
+
+from datetime import datetime
+import pytest
+from src.analysis.gene_analyzer import GeneSequence
+from src.blockchain.data_storage import BlockchainStorage
+from src.experiments.space_experiment import SpaceExperiment, ExperimentParameters
+from src.pipeline import experiment_pipeline
+from src.pipeline.experiment_pipeline import SampleRecord, build_experiment_pipeline
+
+class OfflineBlockchainStorage(BlockchainStorage):
+    """BlockchainStorage with the Ethereum connection stubbed out"""
+
+    def __init__(self):
+        self.chain = []
+        self.pending_data = []
+        self.difficulty = 1
+
+def fake_analyze(sequence):
+    """Top-level stand-in for analyze_sequence so it can go to a process pool"""
+    return {"sequence_id": sequence.sequence_id, "sequence_length": len(sequence.sequence)}
+
+def _experiment():
+    experiment = SpaceExperiment(ExperimentParameters(
+        experiment_id="pipeline_test",
+        microorganism_type="E. coli",
+        duration=30,
+        temperature=25.0,
+        radiation_level=0.5,
+        gravity_level=0.0,
+        start_date=datetime.now()
+    ))
+    experiment.start_experiment()
+    return experiment
+
+def _records(count):
+    return [
+        SampleRecord(
+            observation={"cell_count": 1000 + i},
+            sequence=GeneSequence(f"seq_{i:03d}", "ATCGATCG" * (i + 1), "E. coli", {})
+        )
+        for i in range(count)
+    ]
+
+def test_pipeline_records_analyzes_and_submits(monkeypatch):
+    """Test observations are recorded and reports submitted through add_data"""
+    monkeypatch.setattr(experiment_pipeline, "analyze_sequence", fake_analyze)
+    experiment = _experiment()
+    blockchain = OfflineBlockchainStorage()
+
+    pipeline = build_experiment_pipeline(experiment, blockchain, analysis_workers=2)
+    results = pipeline.run(_records(5))
+
+    assert results == [{"sequence_id": f"seq_{i:03d}", "status": "pending"} for i in range(5)]
+    assert [o["data"] for o in experiment.observations] == [
+        {"cell_count": 1000 + i} for i in range(5)
+    ]
+    submitted = sorted(
+        (entry["data"] for entry in blockchain.pending_data),
+        key=lambda data: data["report"]["sequence_id"]
+    )
+    assert [data["experiment_id"] for data in submitted] == ["pipeline_test"] * 5
+    assert submitted[2]["report"] == {"sequence_id": "seq_002", "sequence_length": 24}
+    assert pipeline.errors == []
+
+def test_pipeline_with_gene_analysis():
+    """Test the real analysis stage produces reports"""
+    pytest.importorskip("Bio")
+    blockchain = OfflineBlockchainStorage()
+
+    pipeline = build_experiment_pipeline(_experiment(), blockchain)
+    assert len(pipeline.run(_records(2))) == 2
+    report = blockchain.pending_data[0]["data"]["report"]
+    assert report["results"]["mutation_analysis"]["sequence_length"] == report["sequence_length"]
@@ -0,0 +1,46 @@
+"""
+Test cases for import-time budget of the src package
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Cumulative import time allowed for a cold `import src.main`, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv("MICROSPACEGEN_IMPORT_BUDGET_MS", "300"))
+HEAVY_MODULES = ("Bio", "numpy", "web3", "eth_account", "dotenv", "http.server")
+
+def _cold_import(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+def _cumulative_us(importtime_log: str, module: str) -> int:
+    """Cumulative microseconds for ``module`` from ``-X importtime`` output"""
+    for line in importtime_log.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+def test_import_skips_heavy_dependencies():
+    """Test importing the entry point does not load heavy dependencies"""
+    result = _cold_import(
+        "import sys, src.main, src.pipeline.experiment_pipeline; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    assert result.stdout.strip() == "[]"
+
+def test_import_time_budget():
+    """Test cold import of src.main stays within the budget"""
+    # Best of three to keep scheduler noise out of the measurement
+    timings = [
+        _cumulative_us(_cold_import("import src.main").stderr, "src.main") / 1000
+        for _ in range(3)
+    ]
+    assert min(timings) <= IMPORT_BUDGET_MS, (
+        f"import src.main took {min(timings):.1f} ms, budget is {IMPORT_BUDGET_MS:.0f} ms"
+    )
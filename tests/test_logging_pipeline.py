@@ -0,0 +1,123 @@
+"""
+Test cases for queue-based logging pipeline
+"""
+
+import json
+import logging
+import time
+import pytest
+from src.utils.logging_pipeline import RateLimitFilter, setup_queue_logging, stop_queue_logging
+
+@pytest.fixture
+def restore_root_logger():
+    """Put the root logger back the way pytest configured it"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    stop_queue_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+def test_queue_logging_writes_rotating_file(tmp_path, restore_root_logger):
+    """Test records reach the configured file via the background listener"""
+    log_file = tmp_path / "logs" / "app.log"
+    listener = setup_queue_logging({
+        "level": "INFO",
+        "file": str(log_file),
+        "max_size": 200,
+        "backup_count": 2,
+        "console": False
+    })
+    handler = listener.handlers[0]
+    assert isinstance(handler, logging.handlers.RotatingFileHandler)
+    assert handler.maxBytes == 200
+    assert handler.backupCount == 2
+
+    logger = logging.getLogger("test.queue")
+    for i in range(20):
+        logger.info("Message %d", i)
+    logger.debug("Below level")
+    stop_queue_logging()
+
+    assert (tmp_path / "logs" / "app.log.1").exists()
+    assert not (tmp_path / "logs" / "app.log.3").exists()
+    assert "Message 19" in log_file.read_text()
+    assert "Below level" not in log_file.read_text()
+
+def test_queue_logging_json_lines(tmp_path, restore_root_logger):
+    """Test structured JSON output keeps extra fields"""
+    log_file = tmp_path / "app.log"
+    setup_queue_logging({"file": str(log_file), "json_lines": True, "console": False})
+
+    logging.getLogger("test.json").warning("Stored %s", "block_1", extra={"block_id": "block_1"})
+    stop_queue_logging()
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["message"] == "Stored block_1"
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "test.json"
+    assert entry["block_id"] == "block_1"
+
+def test_queue_logging_json_exception(tmp_path, restore_root_logger):
+    """Test tracebacks survive the queue as a separate JSON field"""
+    log_file = tmp_path / "app.log"
+    setup_queue_logging({"file": str(log_file), "json_lines": True, "console": False})
+
+    try:
+        raise ValueError("chain broken")
+    except ValueError:
+        logging.getLogger("test.json").exception("Verification failed for %s", "block_2")
+    stop_queue_logging()
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["message"] == "Verification failed for block_2"
+    assert "Traceback" in entry["exception"]
+    assert "ValueError: chain broken" in entry["exception"]
+
+def test_rate_limit_filter_evicts_expired_windows():
+    """Test unique messages do not accumulate forever"""
+    rate_filter = RateLimitFilter(burst=1, period=0.01, max_keys=50)
+    for i in range(200):
+        rate_filter.filter(logging.LogRecord("test.rate", logging.DEBUG, __file__, 0,
+                                             f"Unique {i}", (), None))
+        assert len(rate_filter._windows) <= 51
+
+    time.sleep(0.02)
+    rate_filter.filter(logging.LogRecord("test.rate", logging.DEBUG, __file__, 0, "Last", (), None))
+    assert len(rate_filter._windows) == 1
+
+def test_rate_limit_filter_suppresses_repeats():
+    """Test repetitive messages are limited per template"""
+    rate_filter = RateLimitFilter(burst=3, period=60.0)
+
+    def record(msg, args=(), level=logging.DEBUG):
+        return logging.LogRecord("test.rate", level, __file__, 0, msg, args, None)
+
+    allowed = [rate_filter.filter(record("Observation %d", (i,))) for i in range(10)]
+    assert allowed == [True] * 3 + [False] * 7
+    assert rate_filter.filter(record("Other message"))
+    assert rate_filter.filter(record("Chain broken", level=logging.ERROR))
+
+    rate_filter.period = 0.0
+    resumed = record("Observation %d", (10,))
+    assert rate_filter.filter(resumed)
+    assert resumed.suppressed == 7
+    assert "suppressed 7 similar messages" in resumed.getMessage()
+
+def test_rate_limit_filter_accepts_non_string_messages(tmp_path, restore_root_logger):
+    """Test dict and list messages pass through the limiter without raising"""
+    log_file = tmp_path / "app.log"
+    setup_queue_logging({"file": str(log_file), "console": False, "rate_limit": {"burst": 2}})
+
+    logger = logging.getLogger("test.rate")
+    for _ in range(3):
+        logger.info({"cell_count": 1000})
+    logger.info(["ATCG", "ATCC"])
+    stop_queue_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert sum("{'cell_count': 1000}" in line for line in lines) == 2
+    assert "['ATCG', 'ATCC']" in lines[-1]
@@ -0,0 +1,108 @@
+"""
+Test cases for metrics module
+"""
+
+import time
+import urllib.request
+from datetime import datetime
+import pytest
+from src.utils import metrics
+from src.experiments.space_experiment import SpaceExperiment, ExperimentParameters
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Start each test with an empty, enabled registry"""
+    metrics.registry.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.registry.reset()
+
+def test_timed_records_latency_and_failures():
+    """Test decorator records calls, latency and failures"""
+    @metrics.timed("work")
+    def work(fail=False):
+        if fail:
+            raise ValueError("failed")
+        return 42
+
+    assert work() == 42
+    with pytest.raises(ValueError):
+        work(fail=True)
+
+    assert metrics.registry.get("work_total").value == 2
+    assert metrics.registry.get("work_failures_total").value == 1
+    assert metrics.registry.get("work_duration_seconds").count == 2
+
+def test_disabled_mode_records_nothing():
+    """Test disabled instrumentation falls straight through"""
+    metrics.disable()
+
+    @metrics.timed("idle")
+    def idle():
+        return "ok"
+
+    assert idle() == "ok"
+    with metrics.track("idle_block"):
+        pass
+    metrics.inc("idle_counter")
+    assert metrics.registry.render() == "\n"
+
+def test_record_observation_is_instrumented():
+    """Test experiment observations are counted"""
+    experiment = SpaceExperiment(ExperimentParameters(
+        experiment_id="test_metrics",
+        microorganism_type="E. coli",
+        duration=30,
+        temperature=25.0,
+        radiation_level=0.5,
+        gravity_level=0.0,
+        start_date=datetime.now()
+    ))
+    for _ in range(3):
+        experiment.record_observation({"cell_count": 1000})
+
+    assert metrics.registry.get("record_observation_total").value == 3
+
+def test_prometheus_exposition_over_http():
+    """Test text exposition served from the metrics endpoint"""
+    metrics.observe("latency_seconds", 0.003, "Test latency")
+    metrics.inc("events_total", 2, "Test events")
+
+    server = metrics.start_metrics_server(port=0)
+    try:
+        port = server.server_address[1]
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE microspacegen_events_total counter" in body
+    assert "microspacegen_events_total 2" in body
+    assert 'microspacegen_latency_seconds_bucket{le="0.0025"} 0' in body
+    assert 'microspacegen_latency_seconds_bucket{le="0.005"} 1' in body
+    assert "microspacegen_latency_seconds_count 1" in body
+
+def test_exposition_renders_non_finite_values():
+    """Test NaN and infinities use the exposition format spellings"""
+    metrics.set_gauge("nan_gauge", float("nan"))
+    metrics.set_gauge("pos_gauge", float("inf"))
+    metrics.set_gauge("neg_gauge", float("-inf"))
+
+    body = metrics.registry.render()
+    assert "microspacegen_nan_gauge NaN" in body
+    assert "microspacegen_pos_gauge +Inf" in body
+    assert "microspacegen_neg_gauge -Inf" in body
+
+def test_sampling_profiler_collects_samples():
+    """Test profiler samples the busy thread"""
+    def spin():
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            pass
+
+    with metrics.profile(interval=0.001) as profiler:
+        spin()
+
+    assert profiler.total_samples > 0
+    assert any("spin" in location for location, _ in profiler.top())
@@ -0,0 +1,130 @@
+"""
+Test cases for pipeline runner module
+"""
+
+import asyncio
+import time
+import pytest
+from src.pipeline.runner import PipelineRunner, Stage
+
+def square(value):
+    """Top-level so it can be sent to a process pool"""
+    return value * value
+
+def test_pipeline_runs_stages_in_order():
+    """Test results pass through every stage"""
+    runner = PipelineRunner([
+        Stage("double", lambda x: x * 2),
+        Stage("increment", lambda x: x + 1),
+    ])
+
+    assert runner.run(range(5)) == [1, 3, 5, 7, 9]
+
+def test_pipeline_process_stage():
+    """Test CPU-bound stage running in a process pool"""
+    runner = PipelineRunner([Stage("square", square, concurrency=2, executor="process")])
+
+    assert runner.run(range(6)) == [0, 1, 4, 9, 16, 25]
+
+def test_pipeline_ordered_completion():
+    """Test ordered mode keeps input order despite uneven stage latency"""
+    async def delay(value):
+        await asyncio.sleep(0.01 * (5 - value))
+        return value
+
+    ordered = PipelineRunner([Stage("delay", delay, concurrency=5, executor="async")])
+    assert ordered.run(range(5)) == [0, 1, 2, 3, 4]
+
+    unordered = PipelineRunner([Stage("delay", delay, concurrency=5, executor="async")],
+                               ordered=False)
+    results = unordered.run(range(5))
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert results[0] == 4
+
+def test_pipeline_records_failures():
+    """Test failing items are dropped and recorded"""
+    def check(value):
+        if value == 2:
+            raise ValueError("bad item")
+        return value
+
+    runner = PipelineRunner([Stage("check", check), Stage("pass", lambda x: x)])
+    assert runner.run(range(4)) == [0, 1, 3]
+    assert len(runner.errors) == 1
+    assert runner.errors[0].index == 2
+    assert runner.errors[0].stage == "check"
+    assert runner.metrics["check"].failed == 1
+    assert runner.metrics["pass"].processed == 3
+
+def test_pipeline_backpressure_and_metrics():
+    """Test bounded queues and per-stage metrics"""
+    def slow(value):
+        time.sleep(0.01)
+        return value
+
+    runner = PipelineRunner([Stage("fast", lambda x: x), Stage("slow", slow)], queue_size=2)
+    assert runner.run(range(10)) == list(range(10))
+
+    metrics = {m["stage"]: m for m in runner.get_metrics()}
+    assert metrics["fast"]["processed"] == 10
+    assert metrics["slow"]["processed"] == 10
+    assert metrics["slow"]["queue_depth_max"] <= 2
+    assert metrics["slow"]["throughput"] > 0
+    assert runner.bottleneck() == "slow"
+
+def test_pipeline_stop_drains_in_flight_items():
+    """Test stopping halts input but completes accepted items"""
+    runner = PipelineRunner([Stage("identity", lambda x: x)], queue_size=1)
+
+    def items():
+        for i in range(100):
+            if i == 3:
+                runner.stop()
+            yield i
+
+    assert runner.run(items()) == [0, 1, 2]
+
+def test_pipeline_ordered_buffer_is_bounded():
+    """Test a slow first item does not let the reorder buffer grow unbounded"""
+    async def first_is_slow(value):
+        if value == 0:
+            await asyncio.sleep(0.2)
+        return value
+
+    runner = PipelineRunner([Stage("slow", first_is_slow, concurrency=4, executor="async")],
+                            queue_size=2)
+    assert runner.run(range(500)) == list(range(500))
+    assert runner.max_in_flight == 4
+    assert runner.max_pending <= runner.max_in_flight
+
+def test_pipeline_on_result_failure_does_not_hang():
+    """Test a raising result callback is recorded instead of stalling the feeder"""
+    def callback(result):
+        raise RuntimeError("sink unavailable")
+
+    runner = PipelineRunner([Stage("identity", lambda x: x)], queue_size=2, on_result=callback)
+    assert runner.run(range(50)) == list(range(50))
+    assert len(runner.errors) == 50
+    assert {error.stage for error in runner.errors} == {"on_result"}
+
+def test_pipeline_input_failure_stops_workers(caplog):
+    """Test a raising input iterable propagates without bogus stage failures"""
+    def items():
+        yield from range(5)
+        raise RuntimeError("sensor feed lost")
+
+    runner = PipelineRunner([Stage("identity", lambda x: x)], queue_size=2)
+    with pytest.raises(RuntimeError, match="sensor feed lost"):
+        runner.run(items())
+    assert runner.errors == []
+    assert "after shutdown" not in caplog.text
+
+def test_stage_rejects_unknown_executor():
+    """Test stage validation"""
+    with pytest.raises(ValueError):
+        Stage("bad", square, executor="gpu")
+
+def test_stage_rejects_sync_function_for_async_executor():
+    """Test async stages need a coroutine function"""
+    with pytest.raises(ValueError):
+        Stage("bad", square, executor="async")
@@ -0,0 +1,133 @@
+"""
+Test cases for variant store module
+"""
+
+import pytest
+from src.analysis.gene_analyzer import GeneAnalyzer, GeneSequence
+from src.analysis.variant_store import (
+    Variant, VariantStore, derive_variants, _variants_from_alignment
+)
+
+REFERENCE = "ATCGATCGATCGATCG"
+
+def _store_with_siblings():
+    store = VariantStore()
+    store.add_reference("control", REFERENCE)
+    store.register_variants("flight_1", "control", [
+        Variant(2, "C", "T"),
+        Variant(6, "", "AA"),
+        Variant(10, "CG", "")
+    ])
+    store.register_variants("flight_2", "control", [
+        Variant(2, "C", "T"),
+        Variant(6, "", "A"),
+        Variant(14, "C", "G")
+    ])
+    return store
+
+def test_reconstruct_from_variants():
+    """Test sequences are rebuilt from reference and variants"""
+    store = _store_with_siblings()
+
+    assert store.get_sequence("control") == REFERENCE
+    assert store.get_sequence("flight_1") == "ATTGATAACGATATCG"
+    assert store.get_sequence("flight_2") == "ATTGATACGATCGATGG"
+    assert store.variant_sequences["flight_1"].sequence == "ATTGATAACGATATCG"
+
+def test_reconstruction_cache_is_bounded():
+    """Test rebuilt sequences are reused and the cache stays small"""
+    store = _store_with_siblings()
+    store.cache_size = 1
+
+    first = store.get_sequence("flight_1")
+    assert store.get_sequence("flight_1") is first
+    store.get_sequence("flight_2")
+    assert list(store._reconstructed) == ["flight_2"]
+    assert store.get_sequence("flight_1") == first
+
+def test_compare_siblings_from_variants():
+    """Test sibling comparison through the shared reference"""
+    store = _store_with_siblings()
+    result = store.compare("flight_1", "flight_2", with_alignment=True)
+
+    rows = result["alignment"].splitlines()
+    assert rows[0].replace("-", "") == store.get_sequence("flight_1")
+    assert rows[2].replace("-", "") == store.get_sequence("flight_2")
+
+    columns = len(rows[0])
+    matches = sum(1 for a, b in zip(rows[0], rows[2]) if a == b)
+    assert result["similarity_score"] == pytest.approx(matches / columns)
+
+    expected = [
+        {"position": i, "seq1_base": a, "seq2_base": b}
+        for i, (a, b) in enumerate(zip(rows[0], rows[2])) if a != b
+    ]
+    assert [
+        {k: d[k] for k in ("position", "seq1_base", "seq2_base")}
+        for d in result["differences"]
+    ] == expected
+    assert [d["type"] for d in result["differences"]] == ["indel", "indel", "indel", "mismatch"]
+    assert [d["reference_position"] for d in result["differences"]] == [6, 10, 11, 14]
+
+def test_compare_with_reference():
+    """Test a reference compares against its own variants"""
+    store = _store_with_siblings()
+    result = store.compare("control", "flight_2")
+
+    assert len(result["differences"]) == 3
+    assert result["alignment"] == ""
+    assert store.compare("control", "control")["similarity_score"] == 1.0
+
+def test_register_rejects_invalid_variants():
+    """Test overlapping or mismatched variants are rejected"""
+    store = VariantStore()
+    store.add_reference("control", REFERENCE)
+
+    with pytest.raises(ValueError):
+        store.register_variants("bad", "control", [Variant(2, "G", "T")])
+    with pytest.raises(ValueError):
+        store.register_variants("bad", "control", [Variant(2, "CGA", ""), Variant(3, "G", "T")])
+    with pytest.raises(ValueError):
+        store.register_variants("bad", "missing", [])
+    assert not store.shares_reference("control", "bad")
+
+def test_variants_from_alignment():
+    """Test alignment columns collapse into variants"""
+    variants = _variants_from_alignment("ATCG--ATCG", "ATGGTTA--G", offset=5)
+
+    assert variants == [
+        Variant(7, "C", "G"),
+        Variant(9, "", "TT"),
+        Variant(10, "TC", "")
+    ]
+
+def test_derive_variants_trims_shared_ends():
+    """Test pure indels are found from shared prefix and suffix"""
+    assert derive_variants(REFERENCE, REFERENCE) == []
+    assert derive_variants("ATCGATCG", "ATCGTTATCG") == [Variant(4, "", "TT")]
+    assert derive_variants("ATCGGATCG", "ATCGATCG") == [Variant(4, "G", "")]
+
+def test_analyzer_variant_sequences():
+    """Test analyzer stores siblings as variants and compares them directly"""
+    analyzer = GeneAnalyzer()
+    analyzer.add_sequence(GeneSequence("control", "ATCGATCG", "E. coli", {}))
+    analyzer.add_variant_sequence(
+        GeneSequence("flight_1", "ATCGTTATCG", "E. coli", {"source": "flight"}), "control"
+    )
+    analyzer.add_variant_sequence(
+        GeneSequence("flight_2", "ATCGATCG", "E. coli", {"source": "flight"}), "control"
+    )
+
+    flight = next(s for s in analyzer.sequences if s.sequence_id == "flight_1")
+    assert flight.variants == (Variant(4, "", "TT"),)
+    assert flight.sequence == "ATCGTTATCG"
+
+    result = analyzer.compare_sequences("flight_1", "flight_2")
+    assert result["similarity_score"] == pytest.approx(8 / 10)
+    assert len(result["differences"]) == 2
+
+    with pytest.raises(ValueError):
+        analyzer.add_variant_sequence(GeneSequence("flight_3", "ATCG", "E. coli", {}), "missing")
+    with pytest.raises(ValueError):
+        analyzer.add_variant_sequence(GeneSequence("flight_1", "ATCGATCG", "E. coli", {}), "control")
+    assert sum(s.sequence_id == "flight_1" for s in analyzer.sequences) == 1